@@ -1,7 +1,6 @@
-from math import sqrt, floor, log
+from math import floor, log
 from collections import defaultdict
 import random
-import heapq
 
 
 
@@ -85,17 +84,24 @@ class BinarySearchTree():
 ######################################################
 
 def neighbous(coordinates: list, p: tuple, radius: float):
-    my_heapq = []
-    count = 0
-    
+    # No point is within a negative radius, squaring would hide the sign
+    if radius < 0:
+        return []
+
+    px, py = p
+    radius_squared = radius * radius
+    in_range = []
+
     for (x,y) in coordinates:
-        distance = sqrt((p[0] - x)**2 + (p[1] - y)**2)
+        # Compare squared distances, sqrt is not needed for ordering
+        distance_squared = (px - x)**2 + (py - y)**2
 
-        if distance <= radius:
-            count += 1
-            heapq.heappush(my_heapq, (distance, (x,y)))
+        if distance_squared <= radius_squared:
+            in_range.append((distance_squared, (x,y)))
 
-    result = [value for _, value in my_heapq]
+    # Sort once at the end by distance, closest first, ties keep input order
+    in_range.sort(key=lambda item: item[0])
+    result = [value for _, value in in_range]
     return result
 
 coordinates = [(-5,-5), (-5,0), (0, -5), (5, 5), (5, 0), (0, 5), (-2, 0), (0, -2), (-2, -2), (1, 0), (0, 1), (1, 1)]
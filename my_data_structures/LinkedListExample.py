@@ -1,4 +1,9 @@
+from array import array
+
+
 class Node:
+    __slots__ = ('value', 'next', 'prev')
+
     def __init__(self, value, next_node=None, prev_node=None):
         self.value = value
         self.next = next_node
@@ -75,5 +80,209 @@ class DoublyLinkedList(LinkedList):
         return self.head
 
 
+class ArenaList:
+    # Doubly linked list kept in parallel arrays instead of Node objects: a node
+    # is an integer handle i, its value is data[i] and its neighbours next[i] and
+    # prev[i] (-1 marks either end). Freed slots are reused through a free list
+    # in next and are marked with prev[i] == FREE.
+    FREE = -2
+
+    def __init__(self, values=None, capacity=16):
+        capacity = max(capacity, 1)  # growth doubles the capacity, so it must start above 0
+        self.data = [None] * capacity
+        self.next = array('i', range(1, capacity + 1))
+        self.next[-1] = -1
+        self.prev = array('i', [self.FREE]) * capacity
+        self.free_head = 0
+        self.head = -1
+        self.tail = -1
+        self.length = 0
+        if values is not None:
+            self.add_multiple_nodes(values)
+
+    def __str__(self):
+        return ' -> '.join([str(value) for value in self.values])
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        # yields handles, the way LinkedList yields nodes
+        next_ = self.next
+        current = self.head
+        while current != -1:
+            yield current
+            current = next_[current]
+
+    @property
+    def values(self):
+        return [self.data[handle] for handle in self]
+
+    def _allocate(self, value):
+        if self.free_head == -1:
+            # out of slots, double the arrays and chain the new slots as free
+            capacity = len(self.data)
+            self.data.extend([None] * capacity)
+            self.next.extend(range(capacity + 1, 2 * capacity + 1))
+            self.next[-1] = -1
+            self.prev.extend(array('i', [self.FREE]) * capacity)
+            self.free_head = capacity
+        handle = self.free_head
+        self.free_head = self.next[handle]
+        self.data[handle] = value
+        self.next[handle] = -1
+        self.prev[handle] = -1
+        self.length += 1
+        return handle
+
+    def _check(self, handle):
+        if not (0 <= handle < len(self.data)) or self.prev[handle] == self.FREE:
+            raise ValueError(f'handle = {handle} is not in this list')
+
+    def add_node(self, value):
+        handle = self._allocate(value)
+        if self.head == -1:
+            self.head = handle
+        else:
+            self.next[self.tail] = handle
+            self.prev[handle] = self.tail
+        self.tail = handle
+        return handle
+
+    def add_multiple_nodes(self, values):
+        for value in values:
+            self.add_node(value)
+
+    def add_node_as_head(self, value):
+        handle = self._allocate(value)
+        if self.head == -1:
+            self.tail = handle
+        else:
+            self.next[handle] = self.head
+            self.prev[self.head] = handle
+        self.head = handle
+        return handle
+
+    def insert_after(self, handle, value):
+        self._check(handle)
+        new = self._allocate(value)
+        after = self.next[handle]
+        self.next[new] = after
+        self.prev[new] = handle
+        self.next[handle] = new
+        if after == -1:
+            self.tail = new
+        else:
+            self.prev[after] = new
+        return new
+
+    def unlink(self, handle):
+        self._check(handle)
+        before, after = self.prev[handle], self.next[handle]
+        if before == -1:
+            self.head = after
+        else:
+            self.next[before] = after
+        if after == -1:
+            self.tail = before
+        else:
+            self.prev[after] = before
+        # give the slot back to the free list
+        value = self.data[handle]
+        self.data[handle] = None
+        self.next[handle] = self.free_head
+        self.prev[handle] = self.FREE
+        self.free_head = handle
+        self.length -= 1
+        return value
+
+    def pop_head(self):
+        if self.head == -1:
+            raise IndexError('pop from an empty list')
+        return self.unlink(self.head)
+
+
+class ChunkNode:
+    # the chunk's values are items[start:count]
+    __slots__ = ('items', 'start', 'count', 'next')
+
+    def __init__(self, size):
+        self.items = [None] * size
+        self.start = 0
+        self.count = 0
+        self.next = None
+
+
+class UnrolledLinkedList:
+    # Each ChunkNode holds up to CHUNK_SIZE values, so walking the list does one
+    # pointer hop per chunk instead of one per value. Values are appended at the
+    # tail and popped from the head, so it works as a FIFO queue.
+    CHUNK_SIZE = 16
+
+    def __init__(self, values=None):
+        self.head = None
+        self.tail = None
+        self.length = 0
+        if values is not None:
+            self.add_multiple_nodes(values)
+
+    def __str__(self):
+        return ' -> '.join([str(value) for value in self])
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        chunk = self.head
+        while chunk:
+            yield from chunk.items[chunk.start:chunk.count]
+            chunk = chunk.next
+
+    @property
+    def values(self):
+        return list(self)
+
+    def add_node(self, value):
+        tail = self.tail
+        if tail is None or tail.count == self.CHUNK_SIZE:
+            chunk = ChunkNode(self.CHUNK_SIZE)
+            if tail is None:
+                self.head = chunk
+            else:
+                tail.next = chunk
+            self.tail = tail = chunk
+        tail.items[tail.count] = value
+        tail.count += 1
+        self.length += 1
+
+    def add_multiple_nodes(self, values):
+        for value in values:
+            self.add_node(value)
+
+    def pop_head(self):
+        head = self.head
+        if head is None:
+            raise IndexError('pop from an empty list')
+        value = head.items[head.start]
+        head.items[head.start] = None
+        head.start += 1
+        self.length -= 1
+        if head.start == head.count:
+            # chunk used up, drop it
+            self.head = head.next
+            if self.head is None:
+                self.tail = None
+        return value
+
+
 ll = LinkedList([1,6,9,3])
 print(ll.values)
+
+arena = ArenaList([1,6,9,3])
+arena.add_node_as_head(0)
+arena.pop_head()
+print(arena.values)
+
+unrolled = UnrolledLinkedList(range(40))
+unrolled.pop_head()
+print(len(unrolled), unrolled.values[13:17])
\ No newline at end of file
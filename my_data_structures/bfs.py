@@ -1,3 +1,4 @@
+from collections import deque
 from graph_adjacency_list import GraphAdjacencyList, DirectedGraphAdjacencyList
 
 print('--  THE GRAPH  --')
@@ -7,47 +8,51 @@ graph = DirectedGraphAdjacencyList(vertices=vertices, edges=edges)
 graph.insert_edge((5,6))
 graph.insert_edge((5,1))
 graph.print_graph()
+graph.freeze()
 
 
 
 
-parents = {}
+# parents[i] is the index we reached vertex index i from, -1 if none
+parents = [-1] * len(graph.vertex_ids)
   
 def bfs(graph, start_node):  
-  visited = [start_node]
-  queue = [start_node]
+  # walk the CSR arrays from graph.freeze(), vertices are 0..n-1 indices here
+  indptr, indices, vertex_ids = graph.indptr, graph.indices, graph.vertex_ids
+  start = graph.vertex_index[start_node]
+  visited = bytearray(len(vertex_ids))   # one flag per vertex index
+  visited[start] = 1
+  queue = deque([start])
   while len(queue) != 0:
-    processing_node = queue.pop(0)
+    processing = queue.popleft()
+    processing_node = vertex_ids[processing]
     print(processing_node, end=' ')
 
-    if my_action(node=processing_node, target=target): break
+    if processing_node == target:
+      print(f'Found {target}!')
+      break
 
-    for neighbour in graph.adjacency_list[processing_node]:
+    for neighbour in indices[indptr[processing]:indptr[processing + 1]]:
 
-      if neighbour not in visited:
-        visited.append(neighbour)
+      if not visited[neighbour]:
+        visited[neighbour] = 1
         queue.append(neighbour)
-        parents[neighbour] = processing_node
+        parents[neighbour] = processing
 
-def my_action(node, target=6):
-  if node == target:
-    print(f'Found {target}!')
-    return True
-    
 def print_path_to_target():
   print('--  Path to Target  --')
-  print(target)
-  
-  p = parents[target]
-  while p in parents.keys():
-    print(p)
+  path = []
+  p = graph.vertex_index[target]
+  while p != -1:   # the start vertex has no parent
+    path.append(graph.vertex_ids[p])
     p = parents[p]
-  print(start)
+  print(path[::-1])
 
 start = 0
 target = 6
 bfs(graph=graph, start_node=start)
-print(parents)
+# parents holds CSR indices, print them as the original vertex ids
+print({graph.vertex_ids[i]: graph.vertex_ids[p] for i, p in enumerate(parents) if p != -1})
 
 
 
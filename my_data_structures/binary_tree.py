@@ -1,9 +1,15 @@
+from array import array
+
+
 class Node():
+  __slots__ = ('data', 'left', 'right', 'height')
+
   def __init__(self, data=None):
     self.data = data
     # self.parent = None
     self.left = None
     self.right = None
+    self.height = 1  # only kept up to date by AVLTree
 
   def __str__(self) -> str:
     return(str(self.data))
@@ -11,18 +17,22 @@ class Node():
   def insert(self, data):
     if self.data == None:
       self.data = data
-    if data == self.data:
-      raise Exception(f'data = {data} already exists in this Tree!')
-    if data < self.data:
-      if self.left == None:
-        self.left = Node(data)
-        return
-      self.left.insert(data)
-    elif data > self.data:
-      if self.right == None:
-        self.right = Node(data)
-        return
-      self.right.insert(data)
+      return
+
+    current = self
+    while True:
+      if data == current.data:
+        raise Exception(f'data = {data} already exists in this Tree!')
+      if data < current.data:
+        if current.left == None:
+          current.left = Node(data)
+          return
+        current = current.left
+      else:
+        if current.right == None:
+          current.right = Node(data)
+          return
+        current = current.right
 
   def print_tree(self):
     if self.left:
@@ -33,53 +43,312 @@ class Node():
 
 
   def search(self, data, root):
-    if root == None: return -1
-    if root.data == data: return root
-    if data < root.data: return root.search(data=data, root=root.left)
-    if data > root.data: return root.search(data=data, root=root.right)
+    while root != None:
+      if root.data == data: return root
+      root = root.left if data < root.data else root.right
+    return -1
 
 
   def inorder_traversal(self, root):
     result = []
-    if root:
-      result = result + self.inorder_traversal(root.left)
-      result.append(root.data)
-      result = result + self.inorder_traversal(root.right)
+    stack = []
+    current = root
+    while current or stack:
+      # go as far left as possible, then visit and turn right
+      while current:
+        stack.append(current)
+        current = current.left
+      current = stack.pop()
+      result.append(current.data)
+      current = current.right
     return result
 
   def delete(self, data, root):
-    if root == None:
+    parent = None
+    node = root
+    while node != None and node.data != data:
+      parent = node
+      node = node.left if data < node.data else node.right
+
+    if node == None:
       return root
 
-    if data == root.data:
-      if root.left == None:
-        root = root.right
-      elif root.right == None:
-        root = root.left
-      else:
-        # deletion of nodes with 2 children
-        # find the inorder successor and replace the current node
-        root.data = root.right.minimum().data
-        root.right = self.delete(root.data, root.right)
-    elif data < root.data:
-      root.left = self.delete( data, root.left)
+    if node.left != None and node.right != None:
+      # deletion of nodes with 2 children
+      # find the inorder successor (minimum of the right subtree) and replace the current node,
+      # keeping track of its parent so it can be unlinked below
+      parent = node
+      successor = node.right
+      while successor.left != None:
+        parent = successor
+        successor = successor.left
+      node.data = successor.data
+      node = successor
+
+    # node has at most one child now, splice it out
+    child = node.left if node.left != None else node.right
+    if parent == None:
+      return child
+    if parent.left == node:
+      parent.left = child
     else:
-      root.right = self.delete( data, root.right)
+      parent.right = child
     return root
 
   def maximum(self):
-    max = self.left
-    while (max.left != None):
-      max = max.left
+    max = self
+    while (max.right != None):
+      max = max.right
     return max
 
   def minimum(self):
-    min = self.left
+    min = self
     while (min.left != None):
       min = min.left
     return min
 
 
+class AVLTree():
+  '''
+  Self-balancing BST built from Node, keeps |height(left) - height(right)| <= 1
+  at every node so insert/search/delete stay O(log n) even for sorted input.
+  '''
+  def __init__(self):
+    self.root = None
+
+  def __str__(self) -> str:
+    return str(self.inorder_traversal())
+
+  def _height(self, node):
+    return node.height if node != None else 0
+
+  def _update_height(self, node):
+    node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+  def _rotate_left(self, node):
+    new_root = node.right
+    node.right = new_root.left
+    new_root.left = node
+    self._update_height(node)
+    self._update_height(new_root)
+    return new_root
+
+  def _rotate_right(self, node):
+    new_root = node.left
+    node.left = new_root.right
+    new_root.right = node
+    self._update_height(node)
+    self._update_height(new_root)
+    return new_root
+
+  def _rebalance(self, node):
+    self._update_height(node)
+    balance = self._height(node.left) - self._height(node.right)
+    if balance > 1:
+      if self._height(node.left.left) < self._height(node.left.right):
+        node.left = self._rotate_left(node.left)   # left-right case
+      return self._rotate_right(node)
+    if balance < -1:
+      if self._height(node.right.right) < self._height(node.right.left):
+        node.right = self._rotate_right(node.right)   # right-left case
+      return self._rotate_left(node)
+    return node
+
+  def _rebalance_path(self, path):
+    # walk back up from the changed leaf, reattaching every rotated subtree
+    for i in range(len(path) - 1, -1, -1):
+      node = path[i]
+      subtree = self._rebalance(node)
+      if subtree == node:
+        continue
+      if i == 0:
+        self.root = subtree
+      elif path[i - 1].left == node:
+        path[i - 1].left = subtree
+      else:
+        path[i - 1].right = subtree
+
+  def insert(self, data):
+    if self.root == None:
+      self.root = Node(data)
+      return
+
+    path = []
+    current = self.root
+    while current != None:
+      if data == current.data:
+        raise Exception(f'data = {data} already exists in this Tree!')
+      path.append(current)
+      current = current.left if data < current.data else current.right
+
+    parent = path[-1]
+    if data < parent.data:
+      parent.left = Node(data)
+    else:
+      parent.right = Node(data)
+    self._rebalance_path(path)
+
+  def delete(self, data):
+    path = []
+    node = self.root
+    while node != None and node.data != data:
+      path.append(node)
+      node = node.left if data < node.data else node.right
+
+    if node == None:
+      return
+
+    if node.left != None and node.right != None:
+      # replace with the inorder successor, then remove the successor instead
+      path.append(node)
+      successor = node.right
+      while successor.left != None:
+        path.append(successor)
+        successor = successor.left
+      node.data = successor.data
+      node = successor
+
+    child = node.left if node.left != None else node.right
+    if not path:
+      self.root = child
+      return
+    parent = path[-1]
+    if parent.left == node:
+      parent.left = child
+    else:
+      parent.right = child
+    self._rebalance_path(path)
+
+  def search(self, data):
+    if self.root == None: return -1
+    return self.root.search(data, self.root)
+
+  def inorder_traversal(self):
+    if self.root == None: return []
+    return self.root.inorder_traversal(self.root)
+
+
+class ArenaBST():
+  '''
+  Unbalanced BST like Node, but kept in parallel arrays instead of Node objects:
+  a node is an integer handle i with value data[i] and children left[i]/right[i]
+  (-1 for none). Freed slots are reused through a free list threaded through right.
+  '''
+  def __init__(self, capacity=16):
+    capacity = max(capacity, 1)  # growth doubles the capacity, so it must start above 0
+    self.data = [None] * capacity
+    self.left = array('i', [-1]) * capacity
+    self.right = array('i', range(1, capacity + 1))
+    self.right[-1] = -1
+    self.free_head = 0
+    self.root = -1
+    self.length = 0
+
+  def __str__(self) -> str:
+    return str(self.inorder_traversal())
+
+  def __len__(self):
+    return self.length
+
+  def _allocate(self, data):
+    if self.free_head == -1:
+      # out of slots, double the arrays and chain the new slots as free
+      capacity = len(self.data)
+      self.data.extend([None] * capacity)
+      self.left.extend(array('i', [-1]) * capacity)
+      self.right.extend(range(capacity + 1, 2 * capacity + 1))
+      self.right[-1] = -1
+      self.free_head = capacity
+    handle = self.free_head
+    self.free_head = self.right[handle]
+    self.data[handle] = data
+    self.left[handle] = -1
+    self.right[handle] = -1
+    self.length += 1
+    return handle
+
+  def _free(self, handle):
+    self.data[handle] = None
+    self.left[handle] = -1
+    self.right[handle] = self.free_head
+    self.free_head = handle
+    self.length -= 1
+
+  def insert(self, data):
+    if self.root == -1:
+      self.root = self._allocate(data)
+      return self.root
+
+    current = self.root
+    while True:
+      if data == self.data[current]:
+        raise Exception(f'data = {data} already exists in this Tree!')
+      if data < self.data[current]:
+        if self.left[current] == -1:
+          handle = self._allocate(data)
+          self.left[current] = handle
+          return handle
+        current = self.left[current]
+      else:
+        if self.right[current] == -1:
+          handle = self._allocate(data)
+          self.right[current] = handle
+          return handle
+        current = self.right[current]
+
+  def search(self, data):
+    current = self.root
+    while current != -1:
+      if self.data[current] == data: return current
+      current = self.left[current] if data < self.data[current] else self.right[current]
+    return -1
+
+  def inorder_traversal(self):
+    result = []
+    stack = []
+    current = self.root
+    while current != -1 or stack:
+      # go as far left as possible, then visit and turn right
+      while current != -1:
+        stack.append(current)
+        current = self.left[current]
+      current = stack.pop()
+      result.append(self.data[current])
+      current = self.right[current]
+    return result
+
+  def delete(self, data):
+    parent = -1
+    node = self.root
+    while node != -1 and self.data[node] != data:
+      parent = node
+      node = self.left[node] if data < self.data[node] else self.right[node]
+
+    if node == -1:
+      return
+
+    if self.left[node] != -1 and self.right[node] != -1:
+      # copy the inorder successor (minimum of the right subtree) into node,
+      # then remove the successor instead
+      parent = node
+      successor = self.right[node]
+      while self.left[successor] != -1:
+        parent = successor
+        successor = self.left[successor]
+      self.data[node] = self.data[successor]
+      node = successor
+
+    # node has at most one child now, splice it out
+    child = self.left[node] if self.left[node] != -1 else self.right[node]
+    if parent == -1:
+      self.root = child
+    elif self.left[parent] == node:
+      self.left[parent] = child
+    else:
+      self.right[parent] = child
+    self._free(node)
+
+
 n1 = Node(11)
 
 n1.insert(82)
@@ -99,4 +368,21 @@ n1.print_tree()
 print()
 print()
 print()
-print()
\ No newline at end of file
+print()
+
+
+# Sorted input turns the plain BST into a linked list, the AVL tree stays shallow
+avl = AVLTree()
+for i in range(1, 16):
+  avl.insert(i)
+print(avl)
+print('root:', avl.root, 'height:', avl.root.height)
+
+
+# Same operations on the array-backed tree, removed slots get reused
+arena = ArenaBST()
+for data in [11, 82, 2, 13, 14]:
+  arena.insert(data)
+arena.delete(82)
+arena.insert(90)
+print(arena, len(arena))
\ No newline at end of file
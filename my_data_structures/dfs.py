@@ -8,46 +8,49 @@ graph = DirectedGraphAdjacencyList(vertices=vertices, edges=edges)
 graph.insert_edge((5,6))
 graph.insert_edge((5,1))
 graph.print_graph()
+graph.freeze()
 
 
  
-def dfs(visited: list, node, kill_signal: bool):
-  if kill_signal: return   # Terminate search if the target is found
+def dfs(visited: bytearray, start_node):
+  # walk the CSR arrays from graph.freeze(), vertices are 0..n-1 indices here
+  indptr, indices, vertex_ids = graph.indptr, graph.indices, graph.vertex_ids
+  stack = [graph.vertex_index[start_node]]
+  while stack:
+    current = stack.pop()
+    if visited[current]: continue   # already reached through another path
 
-  print(node)
-  
-  if my_action(node=node, target=target):
-    kill_signal = True
+    node = vertex_ids[current]
+    print(node)
+    visited[current] = 1
 
-  visited.append(node)
+    if node == target:   # Terminate search if the target is found
+      print(f'Found {target}!')
+      break
 
-  for neighbour in graph.adjacency_list[node]:
-    if neighbour not in visited:
-      parents[neighbour] = node
-      dfs(visited, neighbour, kill_signal)
+    # push in reverse so the first neighbour is popped first, like the recursive preorder
+    for neighbour in reversed(indices[indptr[current]:indptr[current + 1]]):
+      if not visited[neighbour]:
+        parents[neighbour] = current
+        stack.append(neighbour)
 
 
-def my_action(node, target=6):
-  if node == target:
-    print(f'Found {target}!')
-    return True
-    
 def print_path_to_target():
   print('--  Path to Target  --')
-  print(target)
-  
-  p = parents[target]
-  while p in parents.keys():
-    print(p)
+  path = []
+  p = graph.vertex_index[target]
+  while p != -1:   # the start vertex has no parent
+    path.append(graph.vertex_ids[p])
     p = parents[p]
-  print(start)
+  print(path[::-1])
 
-kill_signal = False
 start = 0
 target = 6
-parents = {}
-dfs(visited=[], node=start, kill_signal=kill_signal)
-print(parents)
+# parents[i] is the index we reached vertex index i from, -1 if none
+parents = [-1] * len(graph.vertex_ids)
+dfs(visited=bytearray(len(graph.vertex_ids)), start_node=start)
+# parents holds CSR indices, print them as the original vertex ids
+print({graph.vertex_ids[i]: graph.vertex_ids[p] for i, p in enumerate(parents) if p != -1})
 
 
 
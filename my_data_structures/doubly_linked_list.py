@@ -1,4 +1,9 @@
+import heapq
+
+
 class Node:
+  __slots__ = ('data', 'next', 'prev')
+
   def __init__(self, data=None, next=None, prev=None) -> None:
     self.data = data
     self.next = next
@@ -14,13 +19,33 @@ class Node:
     return str(f'{self.prev} - {self.data} - {self.next}')
       
 
+class _Reversed:
+  # heapq is a min-heap, so wrap data to make the largest value come out first
+  def __init__(self, data) -> None:
+    self.data = data
+
+  def __lt__(self, other) -> bool:
+    return self.data > other.data
+
+  def __eq__(self, other) -> bool:
+    return self.data == other.data
+
+
 class SingleLinkedList:
   def __init__(self, node) -> None:
     self.head = node
     self.last_node = node
     self.length = 1
-    self.minimum = node
-    self.maximum = node
+
+    # min/max are served from two heaps, removed nodes are dropped lazily
+    # when they reach the top: an entry is live only if its seq matches _live.
+    # _live is keyed on the node itself (Node defines no __eq__, so it hashes
+    # by identity) and the heaps are rebuilt once stale entries pile up.
+    self._min_heap = []
+    self._max_heap = []
+    self._live = {}
+    self._seq = 0
+    self._track(node)
 
   def __iter__(self):
     current = self.head
@@ -31,45 +56,81 @@ class SingleLinkedList:
   def __str__(self):
     return str([str(node) for node in self])
 
+  def _track(self, node):
+    self._seq += 1
+    self._live[node] = self._seq
+    heapq.heappush(self._min_heap, (node.data, self._seq, node))
+    heapq.heappush(self._max_heap, (_Reversed(node.data), self._seq, node))
+
+  def _peek(self, heap):
+    while heap and self._live.get(heap[0][2]) != heap[0][1]:
+      heapq.heappop(heap)
+    return heap[0][2] if heap else None
+
+  def _compact(self):
+    # stale entries (and the unlinked nodes they reference) only leave a heap
+    # when they reach its top, so rebuild both heaps from _live when they
+    # are mostly stale, keeping the cost amortised O(1) per unlink
+    if len(self._min_heap) <= 2 * self.length and len(self._max_heap) <= 2 * self.length:
+      return
+    self._min_heap = [(node.data, seq, node) for node, seq in self._live.items()]
+    self._max_heap = [(_Reversed(node.data), seq, node) for node, seq in self._live.items()]
+    heapq.heapify(self._min_heap)
+    heapq.heapify(self._max_heap)
+
+  @property
+  def minimum(self):
+    return self._peek(self._min_heap)
+
+  @property
+  def maximum(self):
+    return self._peek(self._max_heap)
+
   def insert(self, node):
     # insert at the end
-    node.prev = self.last_node
-    self.last_node.next = node  
+    if self.head == None:   # every node was unlinked, start over
+      node.prev = None
+      self.head = node
+    else:
+      node.prev = self.last_node
+      self.last_node.next = node  
 
     self.last_node = node # for storing purpose
     self.length += 1
+    self._track(node)
 
+  def unlink(self, node):
+    '''
+    node: a node of this list, spliced out in O(1) through its prev/next pointers
+    '''
+    if node not in self._live:
+      raise ValueError(f'node = {node} is not in this list')
+
+    if node.prev != None:
+      node.prev.next = node.next
+    else:
+      self.head = node.next
+    if node.next != None:
+      node.next.prev = node.prev
+    else:
+      self.last_node = node.prev
+    node.prev = node.next = None
 
-    if self.maximum.data < node.data:
-      self.maximum = node
-    if self.minimum.data > node.data:
-      self.minimum = node
+    self.length -= 1
+    del self._live[node]  # its heap entries are now stale
+    self._compact()
 
   def delete(self, index):
     '''
     index: index of the node to remove, starting from 0
     '''
-    if (index == 0):
-      removed_node = self.head
-      self.head = self.head.next
-    elif (1 <= index < self.length):
-      count = 0
-      pre_node = self.head
-      while count != (index -1):
-        count += 1
-        pre_node = pre_node.next
-      removed_node = pre_node.next
-      pre_node.next = pre_node.next.next  
+    if not (0 <= index < self.length):
+      raise IndexError(f'index = {index} is out of range')
 
-    self.length -= 1
-    
-    # Search min/max again if delete one
-    if self.maximum == removed_node:
-      print('search max')
-      self.maximum = self.search_max()
-    if self.minimum == removed_node:
-      print('search min')
-      self.minimum = self.search_min()
+    removed_node = self.head
+    for _ in range(index):
+      removed_node = removed_node.next
+    self.unlink(removed_node)
  
   def search_data(self, data) -> Node: 
     node_pointer = self.head
@@ -96,7 +157,6 @@ class SingleLinkedList:
     min_node = self.head
 
     while a_node != None:
-      print(a_node.data)
       if min_node.data > a_node.data and a_node.data != None:
         min_node = a_node
       a_node = a_node.next
@@ -1,9 +1,84 @@
+from array import array
+from collections import defaultdict
+
+
+class CSRGraph():
+  '''
+  Read-only graph in CSR form, as returned by csr_from_edges(). Exposes the same
+  vertex_ids/vertex_index/indptr/indices attributes as a frozen GraphAdjacencyList,
+  so bfs/dfs can walk either one.
+  '''
+  def __init__(self, vertex_ids, vertex_index, indptr, indices) -> None:
+    self.vertex_ids = vertex_ids
+    self.vertex_index = vertex_index
+    self.indptr = indptr
+    self.indices = indices
+
+  def freeze(self):
+    return self   # already in CSR form
+
+  def neighbours(self, vertex):
+    i = self.vertex_index[vertex]
+    return [self.vertex_ids[j] for j in self.indices[self.indptr[i]:self.indptr[i + 1]]]
+
+  def print_graph(self):
+    print("The adjacency lists representing the graph:")
+    print('{')
+    for vertex in self.vertex_ids:
+      print(f'  {vertex}: {self.neighbours(vertex)}')
+    print('}')
+
+
+def csr_from_edges(edges, n, directed=False):
+  '''
+  Build a CSRGraph on vertices 0..n-1 straight from a list of (v1, v2) pairs,
+  with a counting sort by source vertex instead of adjacency sets. The rows come
+  out exactly as GraphAdjacencyList/DirectedGraphAdjacencyList + freeze() give
+  them: sorted, a repeated edge stored once and, when undirected, (u, v) and
+  (v, u) treated as the same edge.
+  Still pure Python, not a vectorised build: on 500k edges it is only about
+  1.5-2x faster than construct() + freeze(), and no faster than construct() alone.
+  '''
+  # count the out-degree of every vertex, then prefix-sum into row offsets
+  offsets = array('i', [0]) * (n + 1)
+  for v1, v2 in edges:
+    offsets[v1 + 1] += 1
+    if not directed:
+      offsets[v2 + 1] += 1
+  for i in range(n):
+    offsets[i + 1] += offsets[i]
+
+  # drop every target into the next free slot of its source's row
+  slots = array('i', [0]) * offsets[n]
+  next_slot = offsets[:-1]
+  for v1, v2 in edges:
+    slots[next_slot[v1]] = v2
+    next_slot[v1] += 1
+    if not directed:
+      slots[next_slot[v2]] = v1
+      next_slot[v2] += 1
+
+  # sort each row and keep one copy of repeated neighbours, like the adjacency sets
+  indptr = array('i', [0])
+  indices = array('i')
+  for i in range(n):
+    previous = -1
+    for v in sorted(slots[offsets[i]:offsets[i + 1]]):
+      if v != previous:
+        indices.append(v)
+        previous = v
+    indptr.append(len(indices))
+
+  # ids are already 0..n-1, so both mappings are the identity
+  return CSRGraph(vertex_ids=range(n), vertex_index=range(n), indptr=indptr, indices=indices)
+
+
 class GraphAdjacencyList():
   def __init__(self, vertices, edges) -> None:
     self.adjacency_list = self.construct(vertices, edges)
 
   def construct(self, vertices, edges):
-    adjacency_list = {}
+    adjacency_list = defaultdict(set)
     for vertex in vertices:
       adjacency_list[vertex] = set()
 
@@ -19,21 +94,15 @@ class GraphAdjacencyList():
     v1 = edge[0]
     v2 = edge[1]
 
-    if v1 not in self.adjacency_list.keys():
-      print('Adding new vertex:', v1)
-      self.adjacency_list[v1] = set()
-    if v2 not in self.adjacency_list.keys():
-      print('Adding new vertex:', v2)
-      self.adjacency_list[v2] = set()
-
+    # adjacency_list is a defaultdict(set), a new vertex gets its set on first access
     self.adjacency_list[v1].add(v2)
     self.adjacency_list[v2].add(v1) # for undirected graph, comment this line out if the graph is directed.
 
   def delete_edge(self, edge):
-    if edge[0] not in self.adjacency_list.keys():
+    if edge[0] not in self.adjacency_list:
       print(f'Warning: Vertice = {edge[0]} does not exist in the vertices set. Action terminated.')
       return 
-    if edge[1] not in self.adjacency_list.keys():
+    if edge[1] not in self.adjacency_list:
       print(f'Warning: Vertice = {edge[1]} does not exist in the vertices set. Action terminated.')
       return 
 
@@ -50,6 +119,22 @@ class GraphAdjacencyList():
       print(f'  {key}: {self.adjacency_list[key]}')
     print('}')
 
+  def freeze(self):
+    '''
+    Pack the adjacency sets into CSR (compressed sparse row) arrays for traversal.
+    Vertices are renumbered 0..n-1 (vertex_ids[i] is the original id, vertex_index
+    maps back), and the neighbours of i are indices[indptr[i]:indptr[i+1]].
+    The arrays are a snapshot: call freeze() again after inserting/deleting edges.
+    '''
+    self.vertex_ids = sorted(self.adjacency_list)
+    self.vertex_index = {vertex: i for i, vertex in enumerate(self.vertex_ids)}
+    self.indptr = array('i', [0])
+    self.indices = array('i')
+    for vertex in self.vertex_ids:
+      self.indices.extend(sorted(self.vertex_index[v] for v in self.adjacency_list[vertex]))
+      self.indptr.append(len(self.indices))
+    return self
+
 
 vertices = {0, 1, 2, 3, 4, 5}
 edges = {(0, 1), (1, 2), (0, 3), (1, 3), (3, 4), (2, 5), (4, 5), (2, 4)}
@@ -75,7 +160,7 @@ class DirectedGraphAdjacencyList(GraphAdjacencyList):
     self.adjacency_list = self.construct(vertices, edges)
 
   def construct(self, vertices, edges):
-    adjacency_list = {}
+    adjacency_list = defaultdict(set)
     for vertex in vertices:
       adjacency_list[vertex] = set()
 
@@ -91,21 +176,17 @@ class DirectedGraphAdjacencyList(GraphAdjacencyList):
     v1 = edge[0]
     v2 = edge[1]
 
-    if v1 not in self.adjacency_list.keys():
-      print('Adding new vertex:', v1)
-      self.adjacency_list[v1] = set()
-    if v2 not in self.adjacency_list.keys():
-      print('Adding new vertex:', v2)
-      self.adjacency_list[v2] = set()
-
+    # adjacency_list is a defaultdict(set), a new v1 gets its set on first access
     self.adjacency_list[v1].add(v2)
+    if v2 not in self.adjacency_list:  # v2 is never indexed below, register it as a vertex
+      self.adjacency_list[v2] = set()
     # self.adjacency_list[v2].add(v1) # for undirected graph, comment this line out if the graph is directed.
 
   def delete_edge(self, edge):
-    if edge[0] not in self.adjacency_list.keys():
+    if edge[0] not in self.adjacency_list:
       print(f'Warning: Vertice = {edge[0]} does not exist in the vertices set. Action terminated.')
       return 
-    if edge[1] not in self.adjacency_list.keys():
+    if edge[1] not in self.adjacency_list:
       print(f'Warning: Vertice = {edge[1]} does not exist in the vertices set. Action terminated.')
       return 
 
@@ -1,32 +1,27 @@
-from collections import deque, Counter, defaultdict
-
 class Solution:
     def findRedundantConnection(self, edges):
-        # UNION FIND 1
-        def find(x, root):
-            if root[x] == x:
-                return x
-            root[x] = find(root[x], root)
-            return root[x]
+        # UNION FIND with path compression + union by rank
+        parent = {}
+        rank = {}
 
-        def union(rootX, rootY, root):
-            for i in root.keys():
-                if root[i] == rootY:
-                    root[i] = rootX
+        def find(x):
+            while parent.setdefault(x, x) != x:
+                parent[x] = parent[parent[x]]  # path halving
+                x = parent[x]
+            return x
 
-        root = defaultdict(int)
+        def union(x, y):
+            rootX = find(x)
+            rootY = find(y)
+            if rootX == rootY:
+                return False
+            if rank.get(rootX, 0) < rank.get(rootY, 0):
+                rootX, rootY = rootY, rootX
+            parent[rootY] = rootX
+            if rank.get(rootX, 0) == rank.get(rootY, 0):
+                rank[rootX] = rank.get(rootX, 0) + 1
+            return True
 
         for x, y in edges:
-            rootX = find(x, root)
-            rootY = find(y, root)
-            if rootX == 0 and rootY == 0:
-                root[x] = x
-                root[y] = x
-            elif rootX == 0:
-                root[x] = rootY
-            elif rootY == 0:
-                root[y] = rootX
-            elif rootX == rootY:
+            if not union(x, y):
                 return [x, y]
-            else:
-                union(rootX, rootY, root)
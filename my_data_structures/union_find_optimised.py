@@ -7,12 +7,15 @@ class UnionFind:
         # a standalone vertex with no connection to other vertices.
         self.rank = [1] * size
 
-    # The find function here is the same as that in the disjoint set with path compression.
+    # The find function with path compression, done in two passes so deep trees
+    # do not hit the recursion limit.
     def find(self, x):
-        if x == self.root[x]:
-            return x
-        self.root[x] = self.find(self.root[x])  # path compression
-        return self.root[x]
+        root_x = x
+        while root_x != self.root[root_x]:
+            root_x = self.root[root_x]
+        while x != root_x:  # path compression
+            self.root[x], x = root_x, self.root[x]
+        return root_x
 
     # The union function with union by rank
     def union(self, x, y):